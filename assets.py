@@ -0,0 +1,119 @@
+# assets.py
+import gzip
+import hashlib
+import mimetypes
+import os
+from typing import Dict, Optional
+
+try:
+    import brotli
+except ImportError:  # optional: ohne brotli nur gzip
+    brotli = None
+
+# Dateien unter dieser Größe lohnen sich nicht zu komprimieren
+MIN_COMPRESS_SIZE = 512
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class Asset:
+    def __init__(self, name: str, data: bytes):
+        self.name = name
+        self.digest = hashlib.sha256(data).hexdigest()[:12]
+
+        stem, ext = os.path.splitext(name)
+        self.hashed_name = f"{stem}.{self.digest}{ext}"
+        self.media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+
+        # encoding -> Bytes ("identity" = unkomprimiert)
+        self.variants: Dict[str, bytes] = {"identity": data}
+        if len(data) >= MIN_COMPRESS_SIZE:
+            gz = gzip.compress(data, compresslevel=9, mtime=0)
+            if len(gz) < len(data):
+                self.variants["gzip"] = gz
+            if brotli is not None:
+                br = brotli.compress(data, quality=11)
+                if len(br) < len(data):
+                    self.variants["br"] = br
+
+    def etag(self, encoding: str) -> str:
+        # jede Content-Coding braucht ein eigenes starkes ETag (RFC 9110)
+        if encoding == "identity":
+            return f'"{self.digest}"'
+        return f'"{self.digest}-{encoding}"'
+
+    def pick_encoding(self, accept_encoding: str) -> str:
+        accepted = set()
+        for part in (accept_encoding or "").split(","):
+            coding, _, params = part.partition(";")
+            coding = coding.strip().lower()
+            if not coding:
+                continue
+            q = 1.0
+            for param in params.split(";"):
+                key, _, value = param.partition("=")
+                if key.strip().lower() == "q":
+                    try:
+                        q = float(value.strip())
+                    except ValueError:
+                        q = 0.0
+            # q=0 heißt ausdrücklich "nicht akzeptabel"
+            if q > 0:
+                accepted.add(coding)
+
+        for encoding in ("br", "gzip"):
+            if encoding in self.variants and encoding in accepted:
+                return encoding
+        return "identity"
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Schwacher Vergleich für If-None-Match (Liste, "*" und W/-Präfix)."""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
+class AssetStore:
+    """Liest static/ einmal beim Start ein und hält gehashte,
+    vorkomprimierte Varianten im Speicher."""
+
+    def __init__(self, directory: str, url_prefix: str = "/assets"):
+        self.directory = directory
+        self.url_prefix = url_prefix.rstrip("/")
+        self.by_name: Dict[str, Asset] = {}
+        self.by_hashed_name: Dict[str, Asset] = {}
+        self.load()
+
+    def load(self):
+        self.by_name.clear()
+        self.by_hashed_name.clear()
+        if not os.path.isdir(self.directory):
+            return
+
+        for root, _dirs, files in os.walk(self.directory):
+            for filename in files:
+                path = os.path.join(root, filename)
+                name = os.path.relpath(path, self.directory).replace(os.sep, "/")
+                with open(path, "rb") as f:
+                    asset = Asset(name, f.read())
+                self.by_name[name] = asset
+                self.by_hashed_name[asset.hashed_name] = asset
+
+    def url(self, name: str) -> str:
+        asset = self.by_name.get(name)
+        if not asset:
+            # unbekannte Datei: ungehasht über /static ausliefern
+            return f"/static/{name}"
+        return f"{self.url_prefix}/{asset.hashed_name}"
+
+    def get(self, hashed_name: str) -> Optional[Asset]:
+        return self.by_hashed_name.get(hashed_name)
@@ -14,7 +14,7 @@ from fastapi import (
     Query,
 )
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
@@ -23,6 +23,7 @@ from sqlalchemy import or_, and_
 
 from dotenv import load_dotenv
 
+from assets import Asset, AssetStore, IMMUTABLE_CACHE_CONTROL, etag_matches
 from db import Base, engine, SessionLocal
 from models import User, Message
 from schemas import (
@@ -76,6 +77,13 @@ if not os.path.isdir(templates_dir):
 app.mount("/static", StaticFiles(directory=static_dir), name="static")
 templates = Jinja2Templates(directory=templates_dir)
 
+# gehashte + vorkomprimierte Assets unter /assets, /static bleibt als Fallback
+assets = AssetStore(static_dir, url_prefix="/assets")
+templates.env.globals["asset_url"] = assets.url
+
+# gerenderte Startseite (einmal pro Prozess)
+index_page: Optional[Asset] = None
+
 
 # ---------- Auth Helper ----------
 def get_current_user(token: Optional[str] = None, db: Session = Depends(get_db)) -> User:
@@ -175,10 +183,49 @@ class ConnectionManager:
 manager = ConnectionManager()
 
 
-# ---------- HTML ----------
-@app.get("/", response_class=HTMLResponse)
+# ---------- HTML & Assets ----------
+def asset_response(request: Request, asset: Asset, cache_control: str) -> Response:
+    encoding = asset.pick_encoding(request.headers.get("accept-encoding", ""))
+    etag = asset.etag(encoding)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": cache_control,
+        "Vary": "Accept-Encoding",
+    }
+
+    if etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+
+    body = asset.variants[encoding]
+    if request.method == "HEAD":
+        headers["Content-Length"] = str(len(body))
+        body = b""
+
+    return Response(
+        content=body,
+        media_type=asset.media_type,
+        headers=headers,
+    )
+
+
+@app.api_route("/", methods=["GET", "HEAD"], response_class=HTMLResponse)
 async def index(request: Request):
-    return templates.TemplateResponse("index.html", {"request": request})
+    global index_page
+    if index_page is None:
+        html = templates.get_template("index.html").render(request=request)
+        index_page = Asset("index.html", html.encode("utf-8"))
+    return asset_response(request, index_page, "no-cache")
+
+
+@app.api_route("/assets/{filename:path}", methods=["GET", "HEAD"])
+async def get_asset(filename: str, request: Request):
+    asset = assets.get(filename)
+    if not asset:
+        raise HTTPException(status_code=404, detail="Datei nicht gefunden")
+    return asset_response(request, asset, IMMUTABLE_CACHE_CONTROL)
 
 
 # ---------- Auth & User ----------
@@ -352,13 +399,20 @@ def delete_user(
 
 # ---------- Nachrichten per HTTP ----------
 @app.get("/messages", response_model=List[MessageOut])
-def get_public_messages(limit: int = 50, db: Session = Depends(get_db)):
+def get_public_messages(
+    limit: int = 50,
+    before_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+):
     query = (
         db.query(Message)
         .join(User, Message.user_id == User.id)
         .filter(Message.recipient_id.is_(None))
         .order_by(Message.id.desc())
     )
+    # ältere Seiten beim Hochscrollen nachladen
+    if before_id is not None:
+        query = query.filter(Message.id < before_id)
 
     messages = query.limit(limit).all()
     messages = list(reversed(messages))
@@ -385,6 +439,7 @@ def get_private_messages(
     with_user_id: int,
     token: str,
     limit: int = 100,
+    before_id: Optional[int] = None,
     db: Session = Depends(get_db),
 ):
     current_user = get_current_user(token, db)
@@ -401,6 +456,9 @@ def get_private_messages(
         )
         .order_by(Message.id.desc())
     )
+    # ältere Seiten beim Hochscrollen nachladen
+    if before_id is not None:
+        query = query.filter(Message.id < before_id)
 
     messages = query.limit(limit).all()
     messages = list(reversed(messages))
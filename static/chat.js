@@ -11,6 +11,26 @@ let reconnectTimeoutId = null;
 // userId -> hat ungelesene private Nachrichten
 const unreadPrivate = new Set();
 
+// Nachrichtenliste: nur ein Fenster [windowStart, windowEnd) ist im DOM
+const MAX_RENDERED_MESSAGES = 150;
+const RENDER_STEP = 50;
+const MAX_STORED_MESSAGES = 1000;
+const SCROLL_EDGE_PX = 120;
+
+let chatMessages = []; // aktueller Chat, chronologisch
+let windowStart = 0;
+let windowEnd = 0;
+let pendingMessages = [];
+let flushScheduled = false;
+let historyExhausted = false;
+let historyLoading = false;
+let initialLoading = false;
+let pendingOverflowed = false; // Queue lief über (z.B. Tab im Hintergrund)
+let newerTruncated = false; // neueste Nachrichten verworfen, werden neu geladen
+let jumpToEnd = false; // eigene Nachricht -> ans Ende springen
+let chatGeneration = 0; // verwirft Antworten, wenn der Chat gewechselt wurde
+let scrollScheduled = false;
+
 // DOM Elemente
 const regUsername = document.getElementById("reg-username");
 const regPassword = document.getElementById("reg-password");
@@ -66,7 +86,7 @@ function setLoggedIn(user, token) {
     userInfoCard.classList.remove("hidden");
     currentUsernameSpan.textContent = user.username;
 
-    messagesDiv.innerHTML = "";
+    resetMessages();
     unreadPrivate.clear();
 
     shouldReconnect = true;
@@ -91,7 +111,7 @@ function setLoggedOut() {
     userInfoCard.classList.add("hidden");
     currentUsernameSpan.textContent = "";
 
-    messagesDiv.innerHTML = "";
+    resetMessages();
 
     shouldReconnect = false;
     unreadPrivate.clear();
@@ -250,8 +270,7 @@ function handleIncomingMessage(msg) {
     if (!isPrivate) {
         const target = getCurrentChatTarget();
         if (target.mode === "global") {
-            appendMessage(msg);
-            scrollMessagesToBottom();
+            queueMessage(msg);
         }
     } else {
         const involved =
@@ -263,8 +282,7 @@ function handleIncomingMessage(msg) {
 
         const target = getCurrentChatTarget();
         if (target.mode === "private" && target.userId === partnerId) {
-            appendMessage(msg);
-            scrollMessagesToBottom();
+            queueMessage(msg);
         } else {
             // wir sind NICHT im Chat mit diesem User -> als "ungelesen" markieren
             markPrivateUnread(partnerId);
@@ -421,41 +439,127 @@ function sendCurrentMessage() {
     messageInput.value = "";
 }
 
+function historyPath(target, beforeId) {
+    let path;
+    let limit;
+    if (target.mode === "global") {
+        limit = 50;
+        path = `/messages?limit=${limit}`;
+    } else {
+        limit = 100;
+        path = `/private/messages?with_user_id=${target.userId}&limit=${limit}`;
+    }
+    if (beforeId != null) {
+        path += `&before_id=${beforeId}`;
+    }
+    return { path, limit, authenticated: target.mode !== "global" };
+}
+
 async function loadMessagesForCurrentTarget() {
     if (!currentUser) return;
 
-    messagesDiv.innerHTML = "";
+    resetMessages();
+    const generation = chatGeneration;
+    initialLoading = true;
 
     const target = getCurrentChatTarget();
+    const { path, limit, authenticated } = historyPath(target, null);
 
     try {
-        let path;
-        let authenticated = false;
-
-        if (target.mode === "global") {
-            path = "/messages?limit=50";
-        } else {
-            path = `/private/messages?with_user_id=${target.userId}&limit=100`;
-            authenticated = true;
-        }
-
         const msgs = await apiRequest(
             path,
             "GET",
             null,
             authenticated
         );
+        if (generation !== chatGeneration) return;
 
         if (Array.isArray(msgs)) {
-            msgs.forEach((m) => appendMessage(m));
+            // WS-Nachrichten, die während des Ladens kamen, hinten anhängen
+            const lastId = msgs.length ? msgs[msgs.length - 1].id : -1;
+            const queued = pendingMessages.filter((m) => m.id > lastId);
+
+            if (pendingOverflowed) {
+                // Lücke zwischen Seite und Queue: nur die Queue behalten
+                chatMessages = queued;
+                historyExhausted = false;
+            } else {
+                chatMessages = msgs.concat(queued);
+                historyExhausted = msgs.length < limit;
+            }
+            pendingMessages = [];
+            pendingOverflowed = false;
+            jumpToEnd = false;
+
+            renderLatestMessages();
             scrollMessagesToBottom();
         }
     } catch (err) {
         console.error("Fehler beim Laden der Nachrichten:", err);
+    } finally {
+        if (generation === chatGeneration) {
+            initialLoading = false;
+            if (pendingMessages.length && !flushScheduled) {
+                flushScheduled = true;
+                requestAnimationFrame(flushPendingMessages);
+            }
+        }
+    }
+}
+
+async function loadOlderMessages() {
+    if (historyLoading || initialLoading || historyExhausted || !currentUser) return;
+
+    const generation = chatGeneration;
+    const target = getCurrentChatTarget();
+    const beforeId = chatMessages.length ? chatMessages[0].id : null;
+    const { path, limit, authenticated } = historyPath(target, beforeId);
+
+    historyLoading = true;
+    try {
+        const older = await apiRequest(path, "GET", null, authenticated);
+        if (generation !== chatGeneration || !Array.isArray(older)) return;
+
+        // vorne wurde inzwischen gekürzt: Seite passt nicht mehr an, verwerfen
+        const firstId = chatMessages.length ? chatMessages[0].id : null;
+        if (firstId !== beforeId) {
+            historyExhausted = false;
+            return;
+        }
+
+        historyExhausted = older.length < limit;
+        if (!older.length) return;
+
+        chatMessages = older.concat(chatMessages);
+        windowStart += older.length;
+        windowEnd += older.length;
+        showOlderMessages();
+        capStoredMessages(true);
+    } catch (err) {
+        console.error("Fehler beim Nachladen älterer Nachrichten:", err);
+    } finally {
+        if (generation === chatGeneration) {
+            historyLoading = false;
+        }
     }
 }
 
-function appendMessage(msg) {
+function resetMessages() {
+    chatGeneration++;
+    chatMessages = [];
+    windowStart = 0;
+    windowEnd = 0;
+    pendingMessages = [];
+    historyExhausted = false;
+    historyLoading = false;
+    initialLoading = false;
+    pendingOverflowed = false;
+    newerTruncated = false;
+    jumpToEnd = false;
+    messagesDiv.innerHTML = "";
+}
+
+function createMessageNode(msg) {
     const msgDiv = document.createElement("div");
     msgDiv.classList.add("message");
     if (msg.is_admin) {
@@ -474,9 +578,213 @@ function appendMessage(msg) {
     msgDiv.appendChild(nameSpan);
     msgDiv.appendChild(textSpan);
 
-    messagesDiv.appendChild(msgDiv);
+    return msgDiv;
+}
+
+// rendert chatMessages[from, to) als ein Fragment oben oder unten
+function renderRange(from, to, prepend) {
+    const fragment = document.createDocumentFragment();
+    for (let i = from; i < to; i++) {
+        fragment.appendChild(createMessageNode(chatMessages[i]));
+    }
+    if (prepend) {
+        messagesDiv.insertBefore(fragment, messagesDiv.firstChild);
+    } else {
+        messagesDiv.appendChild(fragment);
+    }
+}
+
+// ersetzt den DOM-Inhalt durch die letzten MAX_RENDERED_MESSAGES Zeilen
+function renderLatestMessages() {
+    messagesDiv.innerHTML = "";
+    windowStart = Math.max(0, chatMessages.length - MAX_RENDERED_MESSAGES);
+    renderRange(windowStart, chatMessages.length, false);
+    windowEnd = chatMessages.length;
+}
+
+// entfernt Zeilen oben, ohne dass der sichtbare Inhalt springt
+function trimRenderedTop(count) {
+    if (count <= 0) return;
+    const previousHeight = messagesDiv.scrollHeight;
+    for (let i = 0; i < count; i++) {
+        messagesDiv.removeChild(messagesDiv.firstElementChild);
+    }
+    messagesDiv.scrollTop -= previousHeight - messagesDiv.scrollHeight;
+    windowStart += count;
+}
+
+function trimRenderedBottom(count) {
+    for (let i = 0; i < count; i++) {
+        messagesDiv.removeChild(messagesDiv.lastElementChild);
+    }
+    windowEnd -= count;
 }
 
+function isNearBottom() {
+    return (
+        messagesDiv.scrollHeight - messagesDiv.scrollTop - messagesDiv.clientHeight <
+        SCROLL_EDGE_PX
+    );
+}
+
+// WS-Nachrichten sammeln und einmal pro Frame rendern
+function queueMessage(msg) {
+    if (currentUser && msg.user_id === currentUser.id) {
+        jumpToEnd = true;
+    }
+
+    pendingMessages.push(msg);
+    // rAF pausiert in Hintergrund-Tabs: Queue begrenzen
+    const overflow = pendingMessages.length - MAX_STORED_MESSAGES;
+    if (overflow > 0) {
+        pendingMessages.splice(0, overflow);
+        pendingOverflowed = true;
+    }
+
+    if (flushScheduled) return;
+    flushScheduled = true;
+    requestAnimationFrame(flushPendingMessages);
+}
+
+function flushPendingMessages() {
+    flushScheduled = false;
+    if (!pendingMessages.length) return;
+    // erstes Laden läuft noch: loadMessagesForCurrentTarget übernimmt die Queue
+    if (initialLoading) return;
+
+    const jump = jumpToEnd;
+    jumpToEnd = false;
+    const follow = jump || (windowEnd === chatMessages.length && isNearBottom());
+
+    if (newerTruncated) {
+        // zwischen Gespeichertem und Queue fehlen Nachrichten
+        pendingMessages = [];
+        pendingOverflowed = false;
+        if (follow) {
+            loadMessagesForCurrentTarget();
+        }
+        return;
+    }
+
+    if (!follow) {
+        // User liest gerade ältere Nachrichten; neue werden beim Runterscrollen gerendert
+        if (pendingOverflowed) {
+            newerTruncated = true;
+        } else {
+            chatMessages.push(...pendingMessages);
+            capStoredMessages();
+        }
+        pendingMessages = [];
+        pendingOverflowed = false;
+        return;
+    }
+
+    const wasAtEnd = windowEnd === chatMessages.length;
+    if (pendingOverflowed) {
+        chatMessages = pendingMessages;
+        historyExhausted = false;
+    } else {
+        chatMessages.push(...pendingMessages);
+    }
+    const overflowed = pendingOverflowed;
+    pendingMessages = [];
+    pendingOverflowed = false;
+
+    if (
+        overflowed ||
+        !wasAtEnd ||
+        chatMessages.length - windowEnd > MAX_RENDERED_MESSAGES
+    ) {
+        // zu viele neue Zeilen: nicht alles rendern und wieder wegwerfen
+        renderLatestMessages();
+    } else {
+        renderRange(windowEnd, chatMessages.length, false);
+        windowEnd = chatMessages.length;
+
+        const rendered = windowEnd - windowStart;
+        if (rendered > MAX_RENDERED_MESSAGES) {
+            trimRenderedTop(rendered - MAX_RENDERED_MESSAGES);
+        }
+    }
+
+    capStoredMessages();
+    scrollMessagesToBottom();
+}
+
+// begrenzt chatMessages auf MAX_STORED_MESSAGES;
+// keepOlder: gerade nachgeladene ältere Seite nicht wieder vorne abschneiden
+function capStoredMessages(keepOlder = false) {
+    let excess = chatMessages.length - MAX_STORED_MESSAGES;
+    if (excess <= 0) return;
+
+    // zuerst alte Nachrichten vor dem Fenster, sie können per before_id nachgeladen werden
+    const front = keepOlder ? 0 : Math.min(excess, windowStart);
+    if (front > 0) {
+        chatMessages.splice(0, front);
+        windowStart -= front;
+        windowEnd -= front;
+        historyExhausted = false;
+        excess -= front;
+    }
+
+    // Fenster hängt weit hinterher: neueste verwerfen, beim Runterscrollen neu laden
+    excess = Math.min(excess, chatMessages.length - windowEnd);
+    if (excess > 0) {
+        chatMessages.length -= excess;
+        newerTruncated = true;
+    }
+}
+
+function showOlderMessages() {
+    if (windowStart === 0) {
+        loadOlderMessages();
+        return;
+    }
+
+    const from = Math.max(0, windowStart - RENDER_STEP);
+    const previousHeight = messagesDiv.scrollHeight;
+    renderRange(from, windowStart, true);
+    messagesDiv.scrollTop += messagesDiv.scrollHeight - previousHeight;
+    windowStart = from;
+
+    const rendered = windowEnd - windowStart;
+    if (rendered > MAX_RENDERED_MESSAGES) {
+        trimRenderedBottom(rendered - MAX_RENDERED_MESSAGES);
+    }
+}
+
+function showNewerMessages() {
+    if (initialLoading) return;
+    if (windowEnd >= chatMessages.length) {
+        if (newerTruncated) {
+            loadMessagesForCurrentTarget();
+        }
+        return;
+    }
+
+    const to = Math.min(chatMessages.length, windowEnd + RENDER_STEP);
+    renderRange(windowEnd, to, false);
+    windowEnd = to;
+
+    const rendered = windowEnd - windowStart;
+    if (rendered > MAX_RENDERED_MESSAGES) {
+        trimRenderedTop(rendered - MAX_RENDERED_MESSAGES);
+    }
+}
+
+messagesDiv.addEventListener("scroll", () => {
+    if (scrollScheduled) return;
+    scrollScheduled = true;
+    requestAnimationFrame(() => {
+        scrollScheduled = false;
+        if (messagesDiv.scrollTop < SCROLL_EDGE_PX) {
+            showOlderMessages();
+        } else if (isNearBottom()) {
+            showNewerMessages();
+        }
+    });
+});
+
 function scrollMessagesToBottom() {
     messagesDiv.scrollTop = messagesDiv.scrollHeight;
 }